@@ -3,12 +3,15 @@
 
 from __future__ import annotations
 
+import functools
 from typing import Any, NamedTuple
 
+import jax
 import jax.numpy as jnp
+import numpy as np
 import numpyro as npro
-from jax.typing import ArrayLike
-from pyrenew.deterministic import DeterministicVariable
+from jax.typing import ArrayLike, DTypeLike
+from pyrenew.deterministic import DeterministicPMF, DeterministicVariable
 from pyrenew.metaclass import RandomVariable
 
 
@@ -18,19 +21,261 @@ class HospitalAdmissionsSample(NamedTuple):
 
     Attributes
     ----------
-    infection_hosp_rate : float, optional
+    infection_hosp_rate : ArrayLike or None
         The infection-to-hospitalization rate. Defaults to None.
     latent_hospital_admissions : ArrayLike or None
         The computed number of hospital admissions. Defaults to None.
     """
 
-    infection_hosp_rate: float | None = None
+    infection_hosp_rate: ArrayLike | None = None
     latent_hospital_admissions: ArrayLike | None = None
 
     def __repr__(self):
         return f"HospitalAdmissionsSample(infection_hosp_rate={self.infection_hosp_rate}, latent_hospital_admissions={self.latent_hospital_admissions})"
 
 
+# Kernel length from which the (opt-in) FFT-based convolution is used
+# instead of the direct one (short kernels are faster to convolve
+# directly).
+_FFT_CONVOLVE_MIN_KERNEL_SIZE = 32
+
+
+@functools.lru_cache
+def _next_fast_len(n: int) -> int:
+    """
+    Finds the smallest 5-smooth integer (i.e., of the form
+    :math:`2^a 3^b 5^c`) greater than or equal to `n`
+
+    Results are memoized, as only a few lengths are used per model.
+
+    Parameters
+    ----------
+    n : int
+        Minimum length.
+
+    Returns
+    -------
+    int
+        A length for which FFTs are efficient.
+    """
+    best = 2 ** max(n - 1, 0).bit_length()
+    p5 = 1
+    while p5 < best:
+        p35 = p5
+        while p35 < best:
+            # Smallest power of two such that p2 * p35 >= n
+            p2 = 2 ** max((-(-n // p35) - 1), 0).bit_length()
+            best = min(best, p2 * p35)
+            p35 *= 3
+        p5 *= 5
+    return best
+
+
+def _direct_convolve(
+    array_to_convolve: ArrayLike,
+    kernel: ArrayLike,
+    compute_dtype: DTypeLike | None = None,
+) -> ArrayLike:
+    """
+    Computes the full discrete convolution of two 1D arrays directly
+
+    The convolution is expressed as a single-channel
+    :py:func:`jax.lax.conv_general_dilated` in channel-last
+    (``"NWC"``) layout, which XLA lowers to a dot product rather than
+    a generic convolution loop.
+
+    Parameters
+    ----------
+    array_to_convolve : ArrayLike
+        A 1D array.
+    kernel : ArrayLike
+        A 1D array.
+    compute_dtype : DTypeLike, optional
+        Data type the inputs are cast to for the products (e.g.,
+        ``jnp.bfloat16``). Accumulation and the output keep the
+        inputs' floating point type. Defaults to None (no cast).
+
+    Returns
+    -------
+    ArrayLike
+        The full convolution, of length
+        ``len(array_to_convolve) + len(kernel) - 1``.
+    """
+    kernel_size = kernel.shape[0]
+    dtype = jnp.result_type(array_to_convolve, kernel, float)
+    if compute_dtype is None:
+        compute_dtype = dtype
+
+    # conv_general_dilated computes a cross-correlation, hence the
+    # reversed kernel.
+    full = jax.lax.conv_general_dilated(
+        array_to_convolve.astype(compute_dtype)[None, :, None],
+        kernel.astype(compute_dtype)[::-1, None, None],
+        window_strides=(1,),
+        padding=[(kernel_size - 1, kernel_size - 1)],
+        dimension_numbers=("NWC", "WIO", "NWC"),
+        preferred_element_type=dtype,
+    )
+
+    return full[0, :, 0]
+
+
+def _fft_convolve(
+    array_to_convolve: ArrayLike,
+    kernel: ArrayLike,
+    kernel_fft: ArrayLike | None = None,
+) -> ArrayLike:
+    """
+    Computes the full discrete convolution of two 1D arrays using FFTs
+
+    Parameters
+    ----------
+    array_to_convolve : ArrayLike
+        A non-negative 1D array.
+    kernel : ArrayLike
+        A non-negative 1D array.
+    kernel_fft : ArrayLike, optional
+        Precomputed real FFT of `kernel`, of length
+        ``_next_fast_len(len(array_to_convolve) + len(kernel) - 1)``.
+        Defaults to None (computed from `kernel`).
+
+    Returns
+    -------
+    ArrayLike
+        The full convolution, of length
+        ``len(array_to_convolve) + len(kernel) - 1``.
+    """
+    n_full = array_to_convolve.shape[0] + kernel.shape[0] - 1
+    n_fft = _next_fast_len(n_full)
+
+    if kernel_fft is None:
+        kernel_fft = jnp.fft.rfft(kernel, n=n_fft)
+
+    full = jnp.fft.irfft(
+        jnp.fft.rfft(array_to_convolve, n=n_fft) * kernel_fft,
+        n=n_fft,
+    )[:n_full]
+
+    # FFT round-off is relative to the largest value of the series, so
+    # small values are inaccurate (hence the FFT path being opt-in) and
+    # may even come out negative. Both inputs are non-negative, so the
+    # latter are clipped to keep the result a valid mean.
+    return jnp.maximum(full, 0)
+
+
+# No buffers are donated: the intermediate arrays never leave the jitted
+# computation (XLA already reuses their buffers), and the latent
+# infections are still used by callers after this call.
+@functools.partial(
+    jax.jit, static_argnames=("convolution_dtype", "fft_convolution")
+)
+def _compute_latent_hospital_admissions(
+    infection_hosp_rate: ArrayLike,
+    latent_infections: ArrayLike,
+    infection_to_admission_interval: ArrayLike,
+    day_of_week_effect: ArrayLike | None = None,
+    hosp_report_prob: ArrayLike | None = None,
+    infection_to_admission_interval_fft: ArrayLike | None = None,
+    convolution_dtype: DTypeLike | None = None,
+    fft_convolution: bool = False,
+) -> ArrayLike:
+    """
+    Computes the expected hospital admissions from latent infections
+
+    Pure (numpyro-free) core of `HospitalAdmissions.sample()`, compiled
+    with :py:func:`jax.jit` so that the convolution and the subsequent
+    elementwise scaling are fused by XLA. Long infection to admission
+    intervals can optionally be convolved via FFTs.
+
+    Parameters
+    ----------
+    infection_hosp_rate : ArrayLike
+        The infection-to-hospitalization rate.
+    latent_infections : ArrayLike
+        Latent infections.
+    infection_to_admission_interval : ArrayLike
+        The infection to hospital admission interval pmf.
+    day_of_week_effect : ArrayLike, optional
+        Day of the week effect, either broadcastable to the latent
+        infections or a vector of seven weekday values to be repeated
+        over the timepoints, whose index 0 corresponds to the first
+        latent infection timepoint. Defaults to None (no effect).
+    hosp_report_prob : ArrayLike, optional
+        Hospital admission reporting probability, broadcastable to the
+        latent infections. Defaults to None (full reporting).
+    infection_to_admission_interval_fft : ArrayLike, optional
+        Precomputed real FFT of the infection to hospital admission
+        interval pmf (see `_fft_convolve()`), only used for long
+        intervals. Defaults to None.
+    convolution_dtype : DTypeLike, optional
+        Reduced precision data type for the products of the direct
+        convolution (see `_direct_convolve()`). Ignored by the FFT
+        convolution. Defaults to None (full precision).
+    fft_convolution : bool, optional
+        Whether to convolve intervals with 32 or more entries via FFTs.
+        Faster for long intervals, but values that are small relative
+        to the maximum of the series lose accuracy. Defaults to False.
+
+    Returns
+    -------
+    ArrayLike
+        The latent hospital admissions, of the same length as the latent
+        infections.
+    """
+    infection_hosp_rate_t = infection_hosp_rate * latent_infections
+
+    # Array shapes are static under jit, so this branch is resolved
+    # at trace time.
+    if (
+        not fft_convolution
+        or infection_to_admission_interval.shape[0]
+        < _FFT_CONVOLVE_MIN_KERNEL_SIZE
+    ):
+        latent_hospital_admissions = _direct_convolve(
+            infection_hosp_rate_t,
+            infection_to_admission_interval,
+            compute_dtype=convolution_dtype,
+        )
+    else:
+        latent_hospital_admissions = _fft_convolve(
+            infection_hosp_rate_t,
+            infection_to_admission_interval,
+            kernel_fft=infection_to_admission_interval_fft,
+        )
+
+    # Static-size trim: the output length only depends on the input
+    # shape, so a single compiled kernel serves every call with the
+    # same number of timepoints.
+    latent_hospital_admissions = jax.lax.slice_in_dim(
+        latent_hospital_admissions, 0, infection_hosp_rate_t.shape[0]
+    )
+
+    # Weekly values are gathered into a length-N vector (constant
+    # indices, folded by XLA) so the scaling is a contiguous multiply.
+    # Index 0 is the first latent infection timepoint, which precedes
+    # the first observation by the seeding period (and any padding).
+    if day_of_week_effect is not None and (
+        jnp.ndim(day_of_week_effect) == 1
+        and jnp.shape(day_of_week_effect)[0] == 7
+    ):
+        day_of_week_effect = day_of_week_effect[
+            jnp.arange(infection_hosp_rate_t.shape[0]) % 7
+        ]
+
+    # Identity (None) factors are skipped, and the remaining ones are
+    # combined first, leaving at most one multiply on the length-N
+    # convolution output.
+    scale = None
+    for factor in (day_of_week_effect, hosp_report_prob):
+        if factor is not None:
+            scale = factor if scale is None else scale * factor
+
+    if scale is not None:
+        latent_hospital_admissions = latent_hospital_admissions * scale
+
+    return latent_hospital_admissions
+
+
 class HospitalAdmissions(RandomVariable):
     r"""
     Latent hospital admissions
@@ -68,6 +313,9 @@ class HospitalAdmissions(RandomVariable):
         latent_hospital_admissions_varname: str = "latent_hospital_admissions",
         day_of_week_effect_rv: RandomVariable | None = None,
         hosp_report_prob_rv: RandomVariable | None = None,
+        convolution_dtype: DTypeLike | None = None,
+        fft_convolution: bool = False,
+        record_latent_hospital_admissions: bool = True,
     ) -> None:
         """
         Default constructor
@@ -83,16 +331,47 @@ class HospitalAdmissions(RandomVariable):
             Name to assign to the deterministic component in numpyro of
             observed hospital admissions.
         day_of_week_effect_rv : RandomVariable, optional
-            Day of the week effect.
+            Day of the week effect. Its sample can be either broadcastable
+            to the latent infections or a vector of seven weekday values,
+            which is then repeated over the timepoints. Index 0 of such a
+            vector corresponds to the first latent infection timepoint,
+            seeding period included. In `HospitalAdmissionsModel`, this
+            is ``i0_size + padding`` days before the first observed day,
+            so a weekly vector aligned with the data must be rotated
+            accordingly. Defaults to 1 (no effect).
         hosp_report_prob_rv  : RandomVariable, optional
             Random variable for the hospital admission reporting
             probability. Defaults to 1 (full reporting).
+        convolution_dtype : DTypeLike, optional
+            Reduced precision data type (e.g., ``jnp.bfloat16``) used for
+            the products of the infection to admission convolution, with
+            accumulation kept in full precision. Ignored by the FFT
+            convolution. Defaults to None (full precision).
+        fft_convolution : bool, optional
+            Whether to convolve infection to admission intervals with 32 or
+            more entries via FFTs instead of directly. Faster for long
+            intervals, but FFT round-off is relative to the maximum of the
+            series, so admissions that are small relative to it (e.g.,
+            early in a fast growing epidemic) lose accuracy, especially in
+            single precision. Defaults to False.
+        record_latent_hospital_admissions : bool, optional
+            Whether to record the latent hospital admissions as a
+            deterministic site named `latent_hospital_admissions_varname`.
+            Disabling it saves storing a length-N array per draw in pure
+            simulations, but removes the admissions from traces,
+            `Predictive` outputs, and MCMC samples. Defaults to True.
 
         Returns
         -------
         None
         """
 
+        # The default RVs are the constant 1 (identity), so they are
+        # neither sampled (and recorded) nor multiplied at every call.
+        # User-provided RVs are always sampled.
+        self._unit_day_of_week_effect = day_of_week_effect_rv is None
+        self._unit_hosp_report_prob = hosp_report_prob_rv is None
+
         if day_of_week_effect_rv is None:
             day_of_week_effect_rv = DeterministicVariable(1, "weekday_effect")
         if hosp_report_prob_rv is None:
@@ -104,6 +383,11 @@ class HospitalAdmissions(RandomVariable):
             hosp_report_prob_rv,
         )
 
+        self.convolution_dtype = convolution_dtype
+        self.fft_convolution = fft_convolution
+        self.record_latent_hospital_admissions = (
+            record_latent_hospital_admissions
+        )
         self.latent_hospital_admissions_varname = (
             latent_hospital_admissions_varname
         )
@@ -114,6 +398,23 @@ class HospitalAdmissions(RandomVariable):
         self.infection_to_admission_interval_rv = (
             infection_to_admission_interval_rv
         )
+
+        # A fixed interval pmf has a fixed FFT for a given number of
+        # timepoints, so it is computed once (with numpy, to keep it out
+        # of any trace) and cached.
+        if isinstance(infection_to_admission_interval_rv, DeterministicPMF):
+            infection_to_admission_interval_rv = (
+                infection_to_admission_interval_rv.basevar
+            )
+        if isinstance(
+            infection_to_admission_interval_rv, DeterministicVariable
+        ):
+            self._fixed_interval = np.asarray(
+                infection_to_admission_interval_rv.vars
+            )
+        else:
+            self._fixed_interval = None
+        self._interval_fft_cache = dict()
         # Why isn't infection_to_admission_interval_rv validated?
 
     @staticmethod
@@ -152,6 +453,48 @@ class HospitalAdmissions(RandomVariable):
 
         return None
 
+    def _get_interval_fft(
+        self, latent_infections: ArrayLike
+    ) -> ArrayLike | None:
+        """
+        Retrieves the cached FFT of a fixed infection to admission interval
+
+        Parameters
+        ----------
+        latent_infections : ArrayLike
+            Latent infections to be convolved with the interval. The FFT
+            matches their number of timepoints and floating point
+            precision.
+
+        Returns
+        -------
+        ArrayLike or None
+            The real FFT of the interval pmf, or None if the FFT
+            convolution is disabled, or the interval is not fixed or is
+            short enough to be convolved directly.
+        """
+        if (
+            not self.fft_convolution
+            or self._fixed_interval is None
+            or self._fixed_interval.shape[0] < _FFT_CONVOLVE_MIN_KERNEL_SIZE
+        ):
+            return None
+
+        n_fft = _next_fast_len(
+            jnp.shape(latent_infections)[0] + self._fixed_interval.shape[0] - 1
+        )
+        complex_dtype = np.result_type(
+            jnp.result_type(latent_infections, float), np.complex64
+        )
+
+        key = (n_fft, complex_dtype)
+        if key not in self._interval_fft_cache:
+            self._interval_fft_cache[key] = np.fft.rfft(
+                self._fixed_interval, n=n_fft
+            ).astype(complex_dtype)
+
+        return self._interval_fft_cache[key]
+
     def sample(
         self,
         latent_infections: ArrayLike,
@@ -173,36 +516,38 @@ class HospitalAdmissions(RandomVariable):
         HospitalAdmissionsSample
         """
 
-        infection_hosp_rate, *_ = self.infect_hosp_rate_rv.sample(**kwargs)
-
-        infection_hosp_rate_t = infection_hosp_rate * latent_infections
+        infection_hosp_rate = self.infect_hosp_rate_rv.sample(**kwargs)[0]
 
-        (
-            infection_to_admission_interval_rv,
-            *_,
-        ) = self.infection_to_admission_interval_rv.sample(**kwargs)
-
-        latent_hospital_admissions = jnp.convolve(
-            infection_hosp_rate_t,
-            infection_to_admission_interval_rv,
-            mode="full",
-        )[: infection_hosp_rate_t.shape[0]]
-
-        # Applying the day of the week effect
-        latent_hospital_admissions = (
-            latent_hospital_admissions
-            * self.day_of_week_effect_rv.sample(**kwargs)[0]
+        infection_to_admission_interval = (
+            self.infection_to_admission_interval_rv.sample(**kwargs)[0]
         )
 
-        # Applying probability of hospitalization effect
-        latent_hospital_admissions = (
-            latent_hospital_admissions
-            * self.hosp_report_prob_rv.sample(**kwargs)[0]
+        day_of_week_effect = None
+        if not self._unit_day_of_week_effect:
+            day_of_week_effect = self.day_of_week_effect_rv.sample(**kwargs)[0]
+
+        hosp_report_prob = None
+        if not self._unit_hosp_report_prob:
+            hosp_report_prob = self.hosp_report_prob_rv.sample(**kwargs)[0]
+
+        latent_hospital_admissions = _compute_latent_hospital_admissions(
+            infection_hosp_rate=infection_hosp_rate,
+            latent_infections=latent_infections,
+            infection_to_admission_interval=infection_to_admission_interval,
+            day_of_week_effect=day_of_week_effect,
+            hosp_report_prob=hosp_report_prob,
+            infection_to_admission_interval_fft=self._get_interval_fft(
+                latent_infections
+            ),
+            convolution_dtype=self.convolution_dtype,
+            fft_convolution=self.fft_convolution,
         )
 
-        npro.deterministic(
-            self.latent_hospital_admissions_varname, latent_hospital_admissions
-        )
+        if self.record_latent_hospital_admissions:
+            npro.deterministic(
+                self.latent_hospital_admissions_varname,
+                latent_hospital_admissions,
+            )
 
         return HospitalAdmissionsSample(
             infection_hosp_rate, latent_hospital_admissions
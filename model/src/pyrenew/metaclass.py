@@ -15,7 +15,7 @@ import numpy as np
 import numpyro as npro
 import polars as pl
 from jax.typing import ArrayLike
-from numpyro.infer import MCMC, NUTS
+from numpyro.infer import MCMC, NUTS, Predictive
 from pyrenew.mcmcutils import plot_posterior, spread_draws
 
 
@@ -310,6 +310,30 @@ class Model(metaclass=ABCMeta):
 
         return None
 
+    @staticmethod
+    def _get_rng_key(rng_key: ArrayLike | None = None) -> ArrayLike:
+        """
+        Returns the given random key, or a new random one if None
+
+        Parameters
+        ----------
+        rng_key : ArrayLike, optional
+            Random key. Defaults to None.
+
+        Returns
+        -------
+        ArrayLike
+            `rng_key`, or a new typed key (see :py:func:`jax.random.key`)
+            seeded from numpy's global random state.
+        """
+        if rng_key is None:
+            rand_int = np.random.randint(
+                np.iinfo(np.int64).min, np.iinfo(np.int64).max
+            )
+            rng_key = jr.key(rand_int)
+
+        return rng_key
+
     def run(
         self,
         num_warmup,
@@ -341,15 +365,100 @@ class Model(metaclass=ABCMeta):
                 nuts_args=nuts_args,
                 mcmc_args=mcmc_args,
             )
-        if rng_key is None:
-            rand_int = np.random.randint(
-                np.iinfo(np.int64).min, np.iinfo(np.int64).max
+        self.mcmc.run(rng_key=self._get_rng_key(rng_key), **kwargs)
+
+        return None
+
+    def prior_predictive(
+        self,
+        num_samples: int,
+        rng_key: ArrayLike | None = None,
+        parallel: bool = True,
+        **kwargs,
+    ) -> dict:
+        """
+        Samples from the prior predictive distribution of the model
+
+        Draws are vectorized over random keys with :py:func:`jax.vmap`
+        (through :py:class:`numpyro.infer.Predictive`) instead of calling
+        `sample()` once per draw.
+
+        Parameters
+        ----------
+        num_samples : int
+            Number of draws.
+        rng_key : ArrayLike, optional
+            Random key. Defaults to None (a random key is generated).
+        parallel : bool, optional
+            Whether to vectorize the draws. Defaults to True.
+        **kwargs : dict, optional
+            Additional keyword arguments passed through to `sample()`.
+
+        Returns
+        -------
+        dict
+            A dictionary mapping site names to arrays of draws, with the
+            draws along the first axis.
+        """
+
+        predictive = Predictive(
+            model=self.sample,
+            num_samples=num_samples,
+            parallel=parallel,
+        )
+
+        # Predictive only takes raw (uint32) keys
+        return predictive(jr.key_data(self._get_rng_key(rng_key)), **kwargs)
+
+    def posterior_predictive(
+        self,
+        rng_key: ArrayLike | None = None,
+        parallel: bool = True,
+        **kwargs,
+    ) -> dict:
+        """
+        Samples from the posterior predictive distribution of the model
+
+        Reuses the posterior draws of the last `run()`; as in
+        `prior_predictive()`, the draws are vectorized with
+        :py:func:`jax.vmap`, so the model is traced once rather than once
+        per draw.
+
+        Parameters
+        ----------
+        rng_key : ArrayLike, optional
+            Random key. Defaults to None (a random key is generated).
+        parallel : bool, optional
+            Whether to vectorize the draws. Defaults to True.
+        **kwargs : dict, optional
+            Additional keyword arguments passed through to `sample()`.
+
+        Returns
+        -------
+        dict
+            A dictionary mapping site names to arrays of draws, with the
+            draws along the first axis.
+
+        Raises
+        ------
+        ValueError
+            If the model has not been run yet.
+        """
+
+        if self.mcmc is None:
+            raise ValueError(
+                "The model must be run before sampling from the posterior "
+                "predictive distribution."
             )
-            rng_key = jr.key(rand_int)
 
-        self.mcmc.run(rng_key=rng_key, **kwargs)
+        predictive = Predictive(
+            model=self.sample,
+            posterior_samples=self.mcmc.get_samples(),
+            parallel=parallel,
+        )
 
-        return None
+        # Predictive only takes raw (uint32) keys
+        return predictive(jr.key_data(self._get_rng_key(rng_key)), **kwargs)
 
     def print_summary(
         self,
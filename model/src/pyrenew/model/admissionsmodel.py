@@ -5,8 +5,8 @@ from __future__ import annotations
 
 from typing import NamedTuple
 
+import jax
 import jax.numpy as jnp
-import pyrenew.arrayutils as au
 from jax.typing import ArrayLike
 from pyrenew.metaclass import Model, RandomVariable, _assert_sample_and_rtype
 from pyrenew.model.rtinfectionsrenewalmodel import RtInfectionsRenewalModel
@@ -18,11 +18,11 @@ class HospModelSample(NamedTuple):
 
     Attributes
     ----------
-    Rt : float | None, optional
+    Rt : ArrayLike | None, optional
         The reproduction number over time. Defaults to None.
     latent_infections : ArrayLike | None, optional
         The estimated number of new infections over time. Defaults to None.
-    infection_hosp_rate : float | None, optional
+    infection_hosp_rate : ArrayLike | None, optional
         The infected hospitalization rate. Defaults to None.
     latent_hosp_admissions : ArrayLike | None, optional
         The estimated latent hospitalizations. Defaults to None.
@@ -30,9 +30,9 @@ class HospModelSample(NamedTuple):
         The sampled or observed hospital admissions. Defaults to None.
     """
 
-    Rt: float | None = None
+    Rt: ArrayLike | None = None
     latent_infections: ArrayLike | None = None
-    infection_hosp_rate: float | None = None
+    infection_hosp_rate: ArrayLike | None = None
     latent_hosp_admissions: ArrayLike | None = None
     observed_hosp_admissions: ArrayLike | None = None
 
@@ -256,47 +256,42 @@ class HospitalAdmissionsModel(Model):
         )
 
         # Sampling the latent hospital admissions
-        (
-            infection_hosp_rate,
-            latent_hosp_admissions,
-            *_,
-        ) = self.sample_latent_hosp_admissions(
+        latent_hosp_admissions_sample = self.sample_latent_hosp_admissions(
             latent_infections=basic_model.latent_infections,
             **kwargs,
         )
+        infection_hosp_rate = latent_hosp_admissions_sample[0]
+        latent_hosp_admissions = latent_hosp_admissions_sample[1]
+
         i0_size = len(latent_hosp_admissions) - n_timepoints
         if self.hosp_admission_obs_process_rv is None:
             observed_hosp_admissions = None
         else:
+            # Simulations cover the whole latent series, while fits only
+            # cover the observed (non-padding) timepoints. Either way,
+            # the observation process is sampled from a single call site
+            # on a static-size slice.
             if data_observed_hosp_admissions is None:
-                (
-                    observed_hosp_admissions,
-                    *_,
-                ) = self.sample_admissions_process(
-                    observed_hosp_admissions_mean=latent_hosp_admissions,
-                    data_observed_hosp_admissions=data_observed_hosp_admissions,
-                    **kwargs,
-                )
+                obs_start = 0
             else:
-                data_observed_hosp_admissions = au.pad_x_to_match_y(
-                    data_observed_hosp_admissions,
+                obs_start = i0_size + padding
+                # The latent series is the data preceded by i0_size
+                # seeding timepoints, so dropping the first obs_start
+                # entries of the (nan) start-padded data is the same as
+                # dropping the first `padding` entries of the data.
+                data_observed_hosp_admissions = jnp.asarray(
+                    data_observed_hosp_admissions
+                )[padding:]
+
+            observed_hosp_admissions = self.sample_admissions_process(
+                observed_hosp_admissions_mean=jax.lax.slice_in_dim(
                     latent_hosp_admissions,
-                    jnp.nan,
-                    pad_direction="start",
-                )
-
-                (
-                    observed_hosp_admissions,
-                    *_,
-                ) = self.sample_admissions_process(
-                    observed_hosp_admissions_mean=latent_hosp_admissions[
-                        i0_size + padding :
-                    ],
-                    data_observed_hosp_admissions=data_observed_hosp_admissions[
-                        i0_size + padding :
-                    ],
-                    **kwargs,
-                )
+                    obs_start,
+                    len(latent_hosp_admissions),
+                ),
+                data_observed_hosp_admissions=data_observed_hosp_admissions,
+                **kwargs,
+            )[0]
 
         return HospModelSample(
             Rt=basic_model.Rt,
@@ -1,17 +1,51 @@
 # -*- coding: utf-8 -*-
 # numpydoc ignore=GL08
 
+import jax
+import jax.experimental
 import jax.numpy as jnp
 import numpy as np
 import numpy.testing as testing
 import numpyro as npro
 import numpyro.distributions as dist
+import pytest
 from pyrenew import transformation as t
-from pyrenew.deterministic import DeterministicPMF
+from pyrenew.deterministic import DeterministicPMF, DeterministicVariable
 from pyrenew.latent import HospitalAdmissions, Infections
+from pyrenew.latent.hospitaladmissions import (
+    _compute_latent_hospital_admissions,
+)
 from pyrenew.metaclass import DistributionalRV
 from pyrenew.process import RtRandomWalkProcess
 
+# Fixtures for the computational core of HospitalAdmissions: a short
+# series with a short interval, and a series spanning about eight
+# orders of magnitude with a 40-day interval.
+INFECTIONS = np.arange(1.0, 41.0)
+INTERVAL = np.array([0.0, 0.25, 0.5, 0.15, 0.1])
+WEEKLY_EFFECT = np.array([0.8, 1.1, 1.1, 1.0, 1.0, 1.0, 1.0])
+GROWING_INFECTIONS = np.exp(np.linspace(0, 18, 200))
+LONG_INTERVAL = np.concatenate(
+    [np.zeros(10), np.arange(30.0, 0.0, -1.0) / 465]
+)
+IHR = 0.05
+
+
+def expected_admissions(latent_infections, interval):  # numpydoc ignore=GL08
+    return np.convolve(IHR * latent_infections, interval)[
+        : len(latent_infections)
+    ]
+
+
+def new_admissions(interval, **kwargs):  # numpydoc ignore=GL08
+    return HospitalAdmissions(
+        infection_to_admission_interval_rv=DeterministicPMF(
+            jnp.asarray(interval), name="inf_hosp"
+        ),
+        infect_hosp_rate_rv=DeterministicVariable(IHR, name="IHR"),
+        **kwargs,
+    )
+
 
 def test_admissions_sample():
     """
@@ -79,3 +113,108 @@ def test_admissions_sample():
         sim_hosp_1.latent_hospital_admissions,
         inf_sampled1[0],
     )
+
+
+@pytest.mark.parametrize(
+    ["day_of_week_effect", "hosp_report_prob", "convolution_dtype", "rtol"],
+    [
+        [np.tile(WEEKLY_EFFECT, 6)[:40], 0.9, None, 1e-6],
+        [WEEKLY_EFFECT, 0.9, None, 1e-6],
+        [None, None, None, 1e-6],
+        [None, None, jnp.bfloat16, 1e-2],
+    ],
+)
+def test_compute_latent_hospital_admissions(
+    day_of_week_effect, hosp_report_prob, convolution_dtype, rtol
+):
+    """
+    Check that the jitted computational core of HospitalAdmissions
+    matches a direct computation, with full-length, weekly (repeated),
+    or omitted (identity) day of the week effect and reporting
+    probability, and with a reduced precision convolution.
+    """
+    expected = expected_admissions(INFECTIONS, INTERVAL)
+    if day_of_week_effect is not None:
+        expected = expected * np.tile(WEEKLY_EFFECT, 6)[:40]
+    if hosp_report_prob is not None:
+        expected = expected * hosp_report_prob
+
+    latent_hospital_admissions = _compute_latent_hospital_admissions(
+        infection_hosp_rate=IHR,
+        latent_infections=jnp.asarray(INFECTIONS),
+        infection_to_admission_interval=jnp.asarray(INTERVAL),
+        day_of_week_effect=day_of_week_effect,
+        hosp_report_prob=hosp_report_prob,
+        convolution_dtype=convolution_dtype,
+    )
+
+    assert latent_hospital_admissions.dtype == jnp.float32
+    testing.assert_allclose(latent_hospital_admissions, expected, rtol=rtol)
+
+
+@pytest.mark.parametrize("fft_convolution", [False, True])
+def test_compute_latent_hospital_admissions_long_interval(fft_convolution):
+    """
+    Check that long infection to admission intervals are convolved
+    accurately over several orders of magnitude by default, while the
+    (opt-in) FFT convolution is only accurate relative to the maximum.
+    """
+    expected = expected_admissions(GROWING_INFECTIONS, LONG_INTERVAL)
+
+    testing.assert_allclose(
+        _compute_latent_hospital_admissions(
+            infection_hosp_rate=IHR,
+            latent_infections=jnp.asarray(GROWING_INFECTIONS),
+            infection_to_admission_interval=jnp.asarray(LONG_INTERVAL),
+            fft_convolution=fft_convolution,
+        ),
+        expected,
+        rtol=0 if fft_convolution else 1e-5,
+        atol=1e-5 * expected.max() if fft_convolution else 0,
+    )
+
+
+@pytest.mark.parametrize("x64", [False, True])
+def test_admissions_sample_cached_interval_fft(x64):
+    """
+    Check that the FFT of a long, fixed infection to admission
+    interval is cached, in the precision of the latent infections.
+    """
+    with jax.experimental.enable_x64(x64):
+        hosp = new_admissions(LONG_INTERVAL, fft_convolution=True)
+
+        with npro.handlers.seed(rng_seed=223):
+            sim_hosp = hosp.sample(
+                latent_infections=jnp.asarray(GROWING_INFECTIONS)
+            )
+
+    assert len(hosp._interval_fft_cache) == 1
+    assert sim_hosp.latent_hospital_admissions.dtype == (
+        jnp.float64 if x64 else jnp.float32
+    )
+
+    expected = expected_admissions(GROWING_INFECTIONS, LONG_INTERVAL)
+    testing.assert_allclose(
+        sim_hosp.latent_hospital_admissions,
+        expected,
+        rtol=1e-6 if x64 else 0,
+        atol=(1e-12 if x64 else 1e-5) * expected.max(),
+    )
+
+
+@pytest.mark.parametrize("record", [True, False])
+def test_admissions_sample_sites(record):
+    """
+    Check that the default (unit) day of the week effect and reporting
+    probability are not sampled (nor recorded), and that the latent
+    hospital admissions are only recorded when requested.
+    """
+    hosp = new_admissions(INTERVAL, record_latent_hospital_admissions=record)
+
+    with npro.handlers.seed(rng_seed=223), npro.handlers.trace() as tr:
+        sim_hosp = hosp.sample(latent_infections=jnp.asarray(INFECTIONS))
+
+    assert "weekday_effect" not in tr
+    assert "hosp_report_prob" not in tr
+    assert ("latent_hospital_admissions" in tr) == record
+    assert sim_hosp.latent_hospital_admissions.shape == (40,)
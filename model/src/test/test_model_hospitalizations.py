@@ -597,3 +597,105 @@ def test_model_hosp_with_obs_model_weekday_phosp():
     # For now the assertion is only about the expected number of rows
     # It should be about the MCMC inference.
     assert inf_mean.to_numpy().shape[0] == 500
+
+
+def test_model_hosp_predictive():
+    """
+    Checks that vectorized prior and posterior predictive draws from the
+    Hospitalization model have the expected shapes.
+    """
+
+    gen_int = DeterministicPMF(
+        jnp.array([0.25, 0.25, 0.25, 0.25]), name="gen_int"
+    )
+
+    I0 = InfectionSeedingProcess(
+        "I0_seeding",
+        DistributionalRV(dist=dist.LogNormal(0, 1), name="I0"),
+        SeedInfectionsZeroPad(n_timepoints=gen_int.size()),
+    )
+
+    latent_infections = Infections()
+    Rt_process = RtRandomWalkProcess(
+        Rt0_dist=dist.TruncatedNormal(loc=1.2, scale=0.2, low=0),
+        Rt_transform=t.ExpTransform().inv,
+        Rt_rw_dist=dist.Normal(0, 0.025),
+    )
+
+    inf_hosp = DeterministicPMF(
+        jnp.array([0, 0, 0, 0.25, 0.5, 0.1, 0.1, 0.05]),
+        name="inf_hosp",
+    )
+
+    latent_admissions = HospitalAdmissions(
+        infection_to_admission_interval_rv=inf_hosp,
+        infect_hosp_rate_rv=DistributionalRV(
+            dist=dist.LogNormal(jnp.log(0.05), 0.05), name="IHR"
+        ),
+    )
+
+    model1 = HospitalAdmissionsModel(
+        gen_int_rv=gen_int,
+        I0_rv=I0,
+        Rt_process_rv=Rt_process,
+        latent_infections_rv=latent_infections,
+        latent_hosp_admissions_rv=latent_admissions,
+        hosp_admission_obs_process_rv=PoissonObservation(),
+    )
+
+    prior_samples = model1.prior_predictive(
+        num_samples=20,
+        rng_key=jr.key(223),
+        n_timepoints_to_simulate=30,
+    )
+
+    assert prior_samples["IHR"].shape == (20,)
+    assert prior_samples["latent_hospital_admissions"].shape[0] == 20
+    assert prior_samples["poisson_rv"].shape == (20, 34)
+
+    with pytest.raises(ValueError, match="must be run"):
+        model1.posterior_predictive(n_timepoints_to_simulate=30)
+
+    model1.run(
+        num_warmup=50,
+        num_samples=50,
+        rng_key=jr.key(272),
+        data_observed_hosp_admissions=prior_samples["poisson_rv"][0, 4:],
+        mcmc_args=dict(progress_bar=False),
+    )
+
+    posterior_samples = model1.posterior_predictive(
+        rng_key=jr.key(223),
+        n_timepoints_to_simulate=30,
+    )
+
+    assert posterior_samples["poisson_rv"].shape == (50, 34)
+
+    # Without an observation process, the latent admissions are still
+    # recorded
+    model0 = HospitalAdmissionsModel(
+        gen_int_rv=gen_int,
+        I0_rv=I0,
+        Rt_process_rv=Rt_process,
+        latent_infections_rv=latent_infections,
+        latent_hosp_admissions_rv=latent_admissions,
+        hosp_admission_obs_process_rv=None,
+    )
+
+    prior_samples = model0.prior_predictive(
+        num_samples=20,
+        rng_key=jr.key(223),
+        n_timepoints_to_simulate=30,
+    )
+
+    assert "poisson_rv" not in prior_samples
+    assert prior_samples["latent_hospital_admissions"].shape == (20, 34)
+
+    # Without a key, a random (typed) key is generated
+    np.random.seed(223)
+    assert model1.prior_predictive(
+        num_samples=20, n_timepoints_to_simulate=30
+    )["poisson_rv"].shape == (20, 34)
+    assert model1.posterior_predictive(n_timepoints_to_simulate=30)[
+        "poisson_rv"
+    ].shape == (50, 34)